@@ -6,8 +6,10 @@
 # and customizable visualization parameters.
 
 import networkx as nx
+import numpy as np
 import matplotlib.pyplot as plt
-from typing import List, Tuple
+from matplotlib.collections import LineCollection
+from typing import List, Optional, Tuple
 
 # Define a type alias for pairs representing ordered relations in the poset
 Pair = Tuple[int, int]
@@ -15,49 +17,123 @@ Pair = Tuple[int, int]
 
 def remove_reflexive_pairs(pairs: List[Pair]) -> List[Pair]:
     """
-    Remove reflexive pairs (x, x) from the input list.
+    Remove reflexive pairs (x, x) and duplicate pairs from the input list.
 
     Reflexive pairs do not appear in the Hasse diagram edges,
     since posets are reflexive by definition but reflexive edges are implicit.
+    Duplicates are dropped in the same pass, keeping first occurrences.
 
     Parameters:
         pairs (List[Pair]): List of ordered pairs representing the poset.
 
     Returns:
-        List[Pair]: List of pairs excluding reflexive pairs.
+        List[Pair]: List of distinct pairs excluding reflexive pairs.
     """
-    return [pair for pair in pairs if pair[0] != pair[1]]
+    seen = set()
+    result = []
+    for pair in pairs:
+        key = (pair[0], pair[1])
+        if key[0] != key[1] and key not in seen:
+            seen.add(key)
+            result.append(pair)
+    return result
 
 
-def transitive_reduction(poset: List[Pair]) -> nx.DiGraph:
+def _reduce_by_bitsets(g: nx.DiGraph, order: list) -> nx.DiGraph:
     """
-    Compute the transitive reduction of the given poset.
+    Compute the transitive reduction of a DAG with bitset reachability rows.
+
+    Each node's descendants are packed into the bits of a Python integer,
+    indexed by topological position, so merging a whole row is a single
+    big-integer OR. Visiting successors in topological order, an edge
+    (v, u) is a cover iff u is not already reachable through an earlier
+    successor; later successors can never reach an earlier one.
+
+    Parameters:
+        g (nx.DiGraph): Directed acyclic graph representing the poset.
+        order (list): Nodes of g in topological order.
+
+    Returns:
+        nx.DiGraph: Directed graph representing the transitive reduction.
+    """
+    idx = {node: i for i, node in enumerate(order)}
+
+    tr = nx.DiGraph()
+    tr.add_nodes_from(order)  # Ensure all nodes are present
+
+    reach = [0] * len(order)  # Bit j of reach[i]: order[j] reachable from order[i]
+    succ = g.succ
+    for i in range(len(order) - 1, -1, -1):
+        row = 0
+        for j in sorted(idx[u] for u in succ[order[i]]):
+            bit = 1 << j
+            if not row & bit:
+                tr.add_edge(order[i], order[j])
+                row |= reach[j] | bit
+        reach[i] = row
+
+    return tr
+
+
+def transitive_reduction(g: nx.DiGraph) -> nx.DiGraph:
+    """
+    Compute the transitive reduction of the given poset graph.
 
     The transitive reduction is the minimal set of edges that
     preserve the reachability of the original poset graph,
     used to create the Hasse diagram without redundant edges.
+    Reflexive pairs (self-loops) are ignored by the reduction
+    and kept unchanged in the result.
 
     Parameters:
-        poset (List[Pair]): List of ordered pairs representing the poset.
+        g (nx.DiGraph): Directed graph of the poset relations.
 
     Returns:
-        nx.DiGraph: Directed graph representing the transitive reduction.
+        nx.DiGraph: New directed graph representing the transitive reduction.
+
+    Raises:
+        nx.NetworkXUnfeasible: If the graph contains a cycle other than
+            a self-loop.
+
+    Example:
+        >>> g = nx.DiGraph([(1, 1), (2, 2), (3, 3), (1, 2), (2, 3), (1, 3)])
+        >>> sorted(transitive_reduction(g).edges)
+        [(1, 1), (1, 2), (2, 2), (2, 3), (3, 3)]
+
+        The covers match NetworkX on a poset given with its reflexive pairs:
+
+        >>> divisors = [1, 2, 3, 4, 6, 12]
+        >>> g = nx.DiGraph(
+        ...     (a, b) for a in divisors for b in divisors if b % a == 0
+        ... )
+        >>> reduced = transitive_reduction(g)
+        >>> covers = set(reduced.edges) - set(nx.selfloop_edges(reduced))
+        >>> loopless = nx.DiGraph(remove_reflexive_pairs(list(g.edges)))
+        >>> covers == set(nx.transitive_reduction(loopless).edges)
+        True
+
+        Cycles are rejected, even when no node has a second successor:
+
+        >>> transitive_reduction(nx.DiGraph([(1, 2), (2, 1)]))  # doctest: +ELLIPSIS
+        Traceback (most recent call last):
+            ...
+        networkx.exception.NetworkXUnfeasible: Graph contains a cycle...
     """
-    g = nx.DiGraph()
-    g.add_edges_from(poset)  # Create graph from poset edges
+    # Reflexive pairs are implicit in a poset; reduce the graph without them
+    loops = list(nx.selfloop_edges(g))
+    core = nx.restricted_view(g, [], loops) if loops else g
 
-    tr = nx.DiGraph()
-    tr.add_nodes_from(g.nodes)  # Ensure all nodes are present
+    # Cyclic input is not a poset: the topological sort rejects it
+    order = list(nx.topological_sort(core))
 
-    # For each edge, check if there is an intermediate node creating
-    # an indirect path; if not, keep the edge.
-    for u, v in g.edges:
-        if not any(
-                nx.has_path(g, u, w) and nx.has_path(g, w, v)
-                for w in g.nodes if w not in (u, v)
-        ):
-            tr.add_edge(u, v)
+    # An edge (u, v) can only be implied by another path when u has a
+    # second successor to route through. Inputs without any such node,
+    # e.g. chains or trees of cover relations, are already reduced.
+    if all(len(succs) <= 1 for succs in core.succ.values()):
+        return g.copy()
 
+    tr = _reduce_by_bitsets(core, order)
+    tr.add_edges_from(loops)
     return tr
 
 
@@ -74,60 +150,75 @@ def assign_levels(graph: nx.DiGraph) -> dict:
     Returns:
         dict: Mapping from node to its assigned level (int).
     """
-    levels = {}
-    # Topological order guarantees that predecessors have levels assigned first
-    for node in nx.topological_sort(graph):
-        preds = list(graph.predecessors(node))
-        if not preds:
-            # Minimal elements start at level 0
-            levels[node] = 0
-        else:
-            # Node level is max predecessor level + 1
-            levels[node] = max(levels[pred] + 1 for pred in preds)
+    succ = graph.succ
+    # Count unprocessed predecessors; a node is ready once all are done
+    pending = {node: len(preds) for node, preds in graph.pred.items()}
+
+    # Minimal elements start at level 0
+    ready = [node for node, count in pending.items() if count == 0]
+    levels = dict.fromkeys(ready, 0)
+
+    # Single pass of Kahn's algorithm: each processed node pushes its
+    # level + 1 to its successors, so a node's level is final (max
+    # predecessor level + 1) by the time it becomes ready.
+    processed = 0
+    while ready:
+        node = ready.pop()
+        processed += 1
+        next_level = levels[node] + 1
+        for child in succ[node]:
+            if levels.get(child, -1) < next_level:
+                levels[child] = next_level
+            pending[child] -= 1
+            if not pending[child]:
+                ready.append(child)
+
+    if processed < len(pending):
+        raise nx.NetworkXUnfeasible("Graph contains a cycle.")
     return levels
 
 
-def is_valid_poset(poset: List[Pair]) -> bool:
+def is_valid_poset(g: nx.DiGraph) -> bool:
     """
-    Validate if the input list of pairs represents a valid poset.
+    Validate if the input graph represents a valid poset.
 
     Checks include:
     - Directed acyclic graph (no cycles)
     - Antisymmetry (no pairs (a,b) and (b,a) unless a == b)
 
     Parameters:
-        poset (List[Pair]): List of ordered pairs representing the poset.
+        g (nx.DiGraph): Directed graph of the poset relations.
 
     Returns:
         bool: True if valid poset, False otherwise.
     """
-    g = nx.DiGraph()
-    g.add_edges_from(poset)
-
-    # Check acyclicity (posets must be DAGs)
-    if not nx.is_directed_acyclic_graph(g):
+    # Check antisymmetry first: no two-way edges between distinct nodes.
+    # This is cheap and exits early on obviously invalid input.
+    succ = g.succ
+    if any(u != v and u in succ[v] for u, v in g.edges):
         return False
 
-    # Check antisymmetry: no two-way edges unless equal nodes
-    edges = set(g.edges)
-    for u, v in edges:
-        if u != v and (v, u) in edges:
-            return False
+    # Reflexive pairs are implicit in a poset and never break validity
+    loops = list(nx.selfloop_edges(g))
+    if loops:
+        g = nx.restricted_view(g, [], loops)
 
-    return True
+    # Check acyclicity (posets must be DAGs)
+    return nx.is_directed_acyclic_graph(g)
 
 
 def display_hasse_diagram(
         poset: List[Pair],
         title: str = "Hasse Diagram",
-        node_color: str = "white"
+        node_color: str = "white",
+        ax: Optional[plt.Axes] = None
 ) -> None:
     """
     Display the Hasse diagram of a poset given as a list of pairs.
 
     This function:
+    - Removes reflexive pairs and builds the poset graph once.
     - Validates the input poset.
-    - Removes reflexive pairs.
     - Computes the transitive reduction.
     - Assigns vertical levels to nodes.
     - Calculates positions for horizontal layout within levels.
@@ -135,45 +226,88 @@ def display_hasse_diagram(
     - Sizes nodes proportionally to the poset size.
     - Sets the window title and displays the graph with Matplotlib.
 
+    When an existing axis is passed, the diagram is drawn into it instead
+    of a new figure, and showing the figure is left to the caller. If the
+    axis already holds this same diagram, its node colors and title are
+    updated in place and the rest of the axis is kept; otherwise the axis
+    is cleared and the diagram drawn from scratch. Validation and
+    transitive reduction run in both cases, so an in-place update only
+    saves the layout and drawing work.
+
     Parameters:
         poset (List[Pair]): List of ordered pairs representing the poset.
         title (str): Title for the plot and window.
         node_color (str): Color of the nodes in the plot (default: "white").
+        ax (Optional[plt.Axes]): Axis to draw into (default: a new figure).
 
     Returns:
         None: The function displays the plot or prints an error.
     """
-    # Remove reflexive edges (implicit in posets)
-    poset = remove_reflexive_pairs(poset)
+    # Remove reflexive edges (implicit in posets) and build the graph
+    # shared by validation and reduction
+    g = nx.DiGraph()
+    g.add_edges_from(remove_reflexive_pairs(poset))
 
     try:
         # Validate poset structure before plotting
-        if not is_valid_poset(poset):
+        if not is_valid_poset(g):
             raise ValueError("Input does not represent a valid poset")
 
         # Compute transitive reduction for minimal edges
-        reduced_graph = transitive_reduction(poset)
+        reduced_graph = transitive_reduction(g)
+
+        # Redrawing the same diagram on a reused axis only needs the node
+        # colors and title updated; the layout and artists stay valid.
+        # The diagram is identified by a key stored on its node artist.
+        caller_ax = ax is not None
+        drawn = None
+        if caller_ax:
+            diagram_key = (
+                frozenset(reduced_graph.nodes), frozenset(reduced_graph.edges)
+            )
+            drawn = next(
+                (c for c in ax.collections
+                 if getattr(c, "hasse_diagram_key", None) == diagram_key),
+                None,
+            )
+        if drawn is not None:
+            drawn.set_facecolor(node_color)
+            ax.set_title(title, fontsize=14, pad=20)
+            if ax.figure.canvas.manager is not None:
+                ax.figure.canvas.manager.set_window_title(title)
+            ax.figure.canvas.draw_idle()
+            return
 
         # Assign vertical levels based on longest path
         levels = assign_levels(reduced_graph)
 
-        # Group nodes by their level for layout
-        level_nodes = {}
-        for node, level in levels.items():
-            level_nodes.setdefault(level, []).append(node)
-
-        # Calculate positions: horizontal spread per level, vertical by level
-        pos = {}
-        max_nodes_in_level = max(len(nodes) for nodes in level_nodes.values())
-        for level, nodes in level_nodes.items():
-            n = len(nodes)
-            x_start = - (n - 1) / 2  # Center nodes horizontally
-            for i, node in enumerate(sorted(nodes)):
-                pos[node] = (x_start + i, -level)  # Negative level to invert y-axis later
+        # Group nodes by level with a single stable sort on the levels
+        nodes_arr = np.fromiter(levels.keys(), dtype=object, count=len(levels))
+        lvl_arr = np.fromiter(levels.values(), dtype=np.int32, count=len(levels))
+        order = np.argsort(lvl_arr, kind="stable")
+        nodes_arr, lvl_arr = nodes_arr[order], lvl_arr[order]
+
+        # Levels are contiguous from 0, so counting them gives each level's
+        # slice of the grouped arrays.
+        counts = np.bincount(lvl_arr)
+        offsets = np.cumsum(counts) - counts
+
+        # Sort labels within each level only, so labels on different levels
+        # never need to be comparable with each other
+        for start, stop in zip(offsets.tolist(), np.cumsum(counts).tolist()):
+            nodes_arr[start:stop] = np.sort(nodes_arr[start:stop])
+
+        # Calculate positions: horizontal spread per level, vertical by level.
+        # Each node's x is its rank within its level, shifted so that the
+        # level is centered horizontally.
+        x_start = -(counts - 1) / 2
+        xs = np.arange(len(nodes_arr)) - np.repeat(offsets - x_start, counts)
+        ys = -lvl_arr  # Negative level to invert y-axis later
+        max_nodes_in_level = int(counts.max())
 
         # Dynamically set figure size based on poset size
         width = max(8, max_nodes_in_level * 1.5)
-        height = max(6, len(level_nodes) * 1.5)
+        height = max(6, len(counts) * 1.5)
 
         # Set node size: bigger for small posets, smaller for large
         n_nodes = reduced_graph.number_of_nodes()
@@ -182,18 +316,22 @@ def display_hasse_diagram(
         else:
             node_size = max(100, int(10000 / n_nodes))
 
-        # Create figure and axis with constrained layout for neat spacing
-        fig, ax = plt.subplots(figsize=(width, height), constrained_layout=True)
+        if not caller_ax:
+            # Create figure and axis with constrained layout for neat spacing
+            fig, ax = plt.subplots(figsize=(width, height), constrained_layout=True)
+        else:
+            # Reuse the caller's axis, dropping whatever was drawn on it
+            ax.clear()
+            fig = ax.figure
 
-        # Set the window title to match plot title
-        fig.canvas.manager.set_window_title(title)
+        # Set the window title to match plot title (only pyplot figures
+        # are attached to a window manager)
+        if fig.canvas.manager is not None:
+            fig.canvas.manager.set_window_title(title)
 
         # Set extra margins
-        xs = [p[0] for p in pos.values()]
-        ys = [p[1] for p in pos.values()]
-
-        x_min, x_max = min(xs), max(xs)
-        y_min, y_max = min(ys), max(ys)
+        x_min, x_max = float(xs.min()), float(xs.max())
+        y_min, y_max = float(ys.min()), float(ys.max())
 
         x_margin = (x_max - x_min) * 0.3 if (x_max - x_min) != 0 else 1
         y_margin = (y_max - y_min) * 0.3 if (y_max - y_min) != 0 else 1
@@ -201,20 +339,37 @@ def display_hasse_diagram(
         ax.set_xlim(x_min - x_margin, x_max + x_margin)
         ax.set_ylim(y_min - y_margin, y_max + y_margin)
 
-        # Draw the graph with customized node appearance
-        nx.draw(
+        # Node positions are only materialized as a dict for NetworkX
+        pos = dict(zip(nodes_arr, zip(xs.tolist(), ys.tolist())))
+
+        # Draw the graph with customized node appearance. Nodes, edges and
+        # labels are drawn separately so the node artist can be kept.
+        nodes_collection = nx.draw_networkx_nodes(
             reduced_graph,
             pos,
             ax=ax,
-            with_labels=True,
             node_size=node_size,
             node_color=node_color,
             edgecolors='black',  # Node border color
             linewidths=1,  # Border width for nodes
+        )
+        # Hasse diagrams omit arrowheads, so all edges fit in one plain
+        # LineCollection below the nodes
+        edge_segments = [(pos[u], pos[v]) for u, v in reduced_graph.edges]
+        ax.add_collection(
+            LineCollection(edge_segments, colors='black', linewidths=1, zorder=1)
+        )
+        nx.draw_networkx_labels(
+            reduced_graph,
+            pos,
+            ax=ax,
             font_size=10,
             font_weight="bold",
-            arrows=False,  # Hasse diagrams omit arrowheads
         )
+        ax.set_axis_off()  # As nx.draw does
+        if caller_ax:
+            # Mark the diagram so a redraw on this axis can find it
+            nodes_collection.hasse_diagram_key = diagram_key
 
         # Set the plot title with a bit of vertical padding
         ax.set_title(title, fontsize=14, pad=20)
@@ -225,8 +380,9 @@ def display_hasse_diagram(
         # Keep aspect ratio equal to avoid distortion
         ax.set_aspect('equal')
 
-        # Display the plot
-        plt.show()
+        # Display the plot, unless the caller owns the figure
+        if not caller_ax:
+            plt.show()
 
     except ValueError as e:
         # Print error message if the input is not a valid poset